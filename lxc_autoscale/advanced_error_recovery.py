@@ -25,7 +25,7 @@ class RetryStrategy(Enum):
     RANDOM_JITTER = "random_jitter"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry mechanism."""
     max_attempts: int = 3
@@ -38,7 +38,7 @@ class RetryConfig:
     non_retryable_exceptions: tuple = (ValueError, TypeError)
 
 
-@dataclass
+@dataclass(slots=True)
 class FallbackConfig:
     """Configuration for fallback mechanisms."""
     enable_graceful_degradation: bool = True
@@ -44,7 +44,7 @@ class AsyncCommandExecutor:
         Returns:
             The command output or None if the command failed
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Use asyncio subprocess for better performance
@@ -61,22 +61,22 @@ class AsyncCommandExecutor:
             
             if process.returncode == 0:
                 result = stdout.decode('utf-8').strip()
-                self._update_stats(True, time.time() - start_time)
+                self._update_stats(True, time.monotonic_ns() - start_ns)
                 logging.debug(f"Local command '{cmd}' executed successfully")
                 return result
             else:
                 error_output = stderr.decode('utf-8').strip()
                 logging.error(f"Local command '{cmd}' failed with exit code {process.returncode}: {error_output}")
-                self._update_stats(False, time.time() - start_time)
+                self._update_stats(False, time.monotonic_ns() - start_ns)
                 return None
                 
         except asyncio.TimeoutError:
             logging.error(f"Local command '{cmd}' timed out after {timeout} seconds")
-            self._update_stats(False, time.time() - start_time)
+            self._update_stats(False, time.monotonic_ns() - start_ns)
             return None
         except Exception as e:
             logging.error(f"Unexpected error executing local command '{cmd}': {e}")
-            self._update_stats(False, time.time() - start_time)
+            self._update_stats(False, time.monotonic_ns() - start_ns)
             return None
     
     async def execute(self, cmd: str, timeout: int = DEFAULT_COMMAND_TIMEOUT) -> Optional[str]:
@@ -175,8 +175,14 @@ class AsyncCommandExecutor:
         
         return results
     
-    def _update_stats(self, success: bool, execution_time: float) -> None:
-        """Update performance statistics."""
+    def _update_stats(self, success: bool, execution_time_ns: int) -> None:
+        """Update performance statistics.
+        
+        Args:
+            success: Whether the command succeeded
+            execution_time_ns: Execution time in nanoseconds from time.monotonic_ns()
+        """
+        execution_time = execution_time_ns / 1_000_000_000
         self._command_stats['total_commands'] += 1
         if success:
             self._command_stats['successful_commands'] += 1
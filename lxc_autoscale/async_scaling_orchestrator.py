@@ -5,6 +5,7 @@ import logging
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from async_command_executor import AsyncCommandExecutor
@@ -57,6 +58,10 @@ class AsyncScalingOrchestrator:
             'optimizations_applied': 0
         }
         
+        # Dedicated single worker so slow notification I/O cannot starve
+        # other blocking work on the default executor
+        self._notify_executor: Optional[ThreadPoolExecutor] = None
+        
         self._initialized = False
     
     async def initialize(self) -> None:
@@ -71,6 +76,11 @@ class AsyncScalingOrchestrator:
             # Initialize async executor with connection pool
             await self.async_executor.initialize_pool()
             
+            if self._notify_executor is None:
+                self._notify_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='scaling-notify'
+                )
+            
             self._initialized = True
             logging.info("Async scaling orchestrator initialized successfully")
             
@@ -114,9 +124,19 @@ class AsyncScalingOrchestrator:
             # Log cycle overview
             await self._log_cycle_overview_async(active_containers, energy_mode, cycle_id)
             
+            # Compute per-container and group metrics in a single pass
+            scaling_groups = self.config_manager.get_horizontal_scaling_groups()
+            utilization_metrics, group_metrics = self.metrics_calculator.compute_all(
+                active_containers,
+                {
+                    group_name: group_config.get('lxc_containers', [])
+                    for group_name, group_config in scaling_groups.items()
+                }
+            )
+            
             # Collect performance metrics concurrently
             metrics_task = asyncio.create_task(
-                self._collect_performance_metrics_async(active_containers)
+                self._collect_performance_metrics_async(active_containers, utilization_metrics)
             )
             
             # Process resource scaling using optimized algorithms
@@ -126,10 +146,9 @@ class AsyncScalingOrchestrator:
             
             # Process horizontal scaling if enabled
             horizontal_results = {}
-            scaling_groups = self.config_manager.get_horizontal_scaling_groups()
             if scaling_groups:
                 horizontal_task = asyncio.create_task(
-                    self._process_horizontal_scaling_async(active_containers)
+                    self._process_horizontal_scaling_async(active_containers, group_metrics)
                 )
                 horizontal_results = await horizontal_task
             
@@ -199,14 +218,18 @@ class AsyncScalingOrchestrator:
             behavior_mode = self.config_manager.get_default('behaviour', 'normal')
             behavior_multiplier = self.metrics_calculator.get_behavior_multiplier()
             
-            # Get resource utilization statistics
-            cpu_usages = [data.get('cpu', 0) for data in containers_data.values()]
-            memory_utilizations = []
-            
+            # Aggregate resource utilization in a single pass over the containers
+            total_cpu = total_mem_util = 0.0
+            max_cpu = max_mem_util = 0.0
             for data in containers_data.values():
-                mem_usage = data.get('mem', 0)
-                mem_total = data.get('initial_memory', 1)
-                memory_utilizations.append((mem_usage / mem_total) * 100)
+                cpu_usage = data.get('cpu', 0)
+                mem_util = (data.get('mem', 0) / data.get('initial_memory', 1)) * 100
+                total_cpu += cpu_usage
+                total_mem_util += mem_util
+                if cpu_usage > max_cpu:
+                    max_cpu = cpu_usage
+                if mem_util > max_mem_util:
+                    max_mem_util = mem_util
             
             overview_data = {
                 'cycle_id': cycle_id,
@@ -216,10 +239,10 @@ class AsyncScalingOrchestrator:
                 'off_peak_hours': is_off_peak,
                 'behavior_mode': behavior_mode,
                 'behavior_multiplier': behavior_multiplier,
-                'avg_cpu_usage': round(sum(cpu_usages) / len(cpu_usages), 2) if cpu_usages else 0,
-                'avg_memory_utilization': round(sum(memory_utilizations) / len(memory_utilizations), 2) if memory_utilizations else 0,
-                'max_cpu_usage': round(max(cpu_usages), 2) if cpu_usages else 0,
-                'max_memory_utilization': round(max(memory_utilizations), 2) if memory_utilizations else 0
+                'avg_cpu_usage': round(total_cpu / total_containers, 2) if total_containers else 0,
+                'avg_memory_utilization': round(total_mem_util / total_containers, 2) if total_containers else 0,
+                'max_cpu_usage': round(max_cpu, 2),
+                'max_memory_utilization': round(max_mem_util, 2)
             }
             
             logging.info(f"Cycle overview: {overview_data}")
@@ -235,19 +258,24 @@ class AsyncScalingOrchestrator:
         except Exception as e:
             logging.error(f"Error logging cycle overview: {e}")
     
-    async def _collect_performance_metrics_async(self, containers_data: Dict[str, Dict[str, Any]]) -> None:
+    async def _collect_performance_metrics_async(
+        self,
+        containers_data: Dict[str, Dict[str, Any]],
+        utilization_metrics: Dict[str, Dict[str, float]]
+    ) -> None:
         """Collect and log performance metrics asynchronously.
         
         Args:
             containers_data: Container resource usage data
+            utilization_metrics: Utilization metrics by container ID
         """
         try:
             # Process metrics collection concurrently for better performance
             tasks = []
             
-            for ctid, usage_data in containers_data.items():
+            for ctid in containers_data:
                 task = asyncio.create_task(
-                    self._process_container_metrics(ctid, usage_data)
+                    self._process_container_metrics(ctid, utilization_metrics[ctid])
                 )
                 tasks.append(task)
             
@@ -257,18 +285,14 @@ class AsyncScalingOrchestrator:
         except Exception as e:
             logging.error(f"Error collecting performance metrics: {e}")
     
-    async def _process_container_metrics(self, ctid: str, usage_data: Dict[str, Any]) -> None:
+    async def _process_container_metrics(self, ctid: str, container_metrics: Dict[str, float]) -> None:
         """Process metrics for a single container.
         
         Args:
             ctid: Container ID
-            usage_data: Container usage data
+            container_metrics: Utilization metrics of the container
         """
         try:
-            # Calculate utilization metrics
-            utilization_metrics = self.metrics_calculator.calculate_resource_utilization({ctid: usage_data})
-            container_metrics = utilization_metrics.get(ctid, {})
-            
             # Add timestamp and container info
             metrics = {
                 'timestamp': datetime.now().isoformat(),
@@ -290,11 +314,16 @@ class AsyncScalingOrchestrator:
         except Exception as e:
             logging.error(f"Error processing metrics for container {ctid}: {e}")
     
-    async def _process_horizontal_scaling_async(self, containers_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    async def _process_horizontal_scaling_async(
+        self,
+        containers_data: Dict[str, Dict[str, Any]],
+        group_metrics: Dict[str, Dict[str, float]]
+    ) -> Dict[str, Any]:
         """Process horizontal scaling asynchronously.
         
         Args:
             containers_data: Container resource usage data
+            group_metrics: Group metrics by group name
             
         Returns:
             Dictionary with horizontal scaling results
@@ -304,7 +333,7 @@ class AsyncScalingOrchestrator:
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: self.horizontal_scaler.manage_horizontal_scaling(containers_data)
+                lambda: self.horizontal_scaler.manage_horizontal_scaling(containers_data, group_metrics)
             )
             
             return {'success': True, 'result': result}
@@ -356,7 +385,7 @@ class AsyncScalingOrchestrator:
         try:
             # Send notification in executor to avoid blocking
             await asyncio.get_event_loop().run_in_executor(
-                None,
+                self._notify_executor,
                 lambda: safe_execute(
                     send_notification,
                     f"Async Scaling Cycle Error - {cycle_id}",
@@ -447,6 +476,10 @@ class AsyncScalingOrchestrator:
             await self.resource_manager.cleanup()
             await cleanup_global_cache()
             
+            if self._notify_executor is not None:
+                self._notify_executor.shutdown(wait=False)
+                self._notify_executor = None
+            
             self._initialized = False
             logging.info("Async scaling orchestrator cleanup completed")
             
@@ -20,7 +20,7 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker."""
     failure_threshold: int = 5          # Number of failures before opening
@@ -30,7 +30,7 @@ class CircuitBreakerConfig:
     expected_exceptions: tuple = (Exception,)  # Exceptions that count as failures
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerStats:
     """Statistics for circuit breaker monitoring."""
     total_requests: int = 0
@@ -4,7 +4,7 @@ import logging
 import os
 import sys
 from socket import gethostname
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Union
 
 import yaml
 
@@ -36,6 +36,7 @@ class ConfigManager:
         self._tier_configurations: Dict[str, Dict[str, Any]] = {}
         self._horizontal_scaling_groups: Dict[str, Dict[str, Any]] = {}
         self._ignore_lxc: Set[str] = set()
+        self._reload_callbacks: List[Callable[[], None]] = []
         
         self._initialize_defaults()
         self._load_configuration()
@@ -283,6 +284,14 @@ class ConfigManager:
         """
         return str(ctid) in self._ignore_lxc
     
+    def get_ignored_containers(self) -> FrozenSet[str]:
+        """Get a snapshot of the container IDs that should be ignored.
+        
+        Returns:
+            Frozen set of ignored container IDs
+        """
+        return frozenset(self._ignore_lxc)
+    
     def get_proxmox_hostname(self) -> str:
         """Get Proxmox hostname.
         
@@ -291,12 +300,27 @@ class ConfigManager:
         """
         return gethostname()
     
+    def register_reload_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback invoked after the configuration is reloaded.
+        
+        Args:
+            callback: Callable taking no arguments
+        """
+        self._reload_callbacks.append(callback)
+    
     def reload(self) -> None:
         """Reload configuration from file."""
         logging.info("Reloading configuration...")
         self._initialize_defaults()
         self._load_configuration()
         self._validate_configuration()
+        
+        for callback in self._reload_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logging.error(f"Error in configuration reload callback: {e}")
+        
         logging.info("Configuration reloaded successfully")
 
 
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from constants import (
     DEFAULT_SCALE_IN_GRACE_PERIOD, DEFAULT_SCALE_OUT_GRACE_PERIOD,
@@ -29,17 +29,26 @@ class HorizontalScaler:
         self.metrics_calculator = metrics_calculator
         self.scale_last_action: Dict[str, datetime] = {}
     
-    def manage_horizontal_scaling(self, containers_data: Dict[str, Dict[str, Any]]) -> None:
+    def manage_horizontal_scaling(
+        self,
+        containers_data: Dict[str, Dict[str, Any]],
+        group_metrics: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> None:
         """Manage horizontal scaling for all configured groups.
         
         Args:
             containers_data: Container resource usage data
+            group_metrics: Optional precomputed metrics by group name, as
+                returned by MetricsCalculator.compute_all
         """
         scaling_groups = self.config_manager.get_horizontal_scaling_groups()
         
         for group_name, group_config in scaling_groups.items():
             try:
-                self._process_scaling_group(group_name, group_config, containers_data)
+                self._process_scaling_group(
+                    group_name, group_config, containers_data,
+                    group_metrics.get(group_name) if group_metrics else None
+                )
             except Exception as e:
                 logging.exception(f"Error in horizontal scaling for group {group_name}: {e}")
                 self._log_scaling_event(group_name, 'horizontal_scaling_error', {
@@ -51,7 +60,8 @@ class HorizontalScaler:
         self,
         group_name: str,
         group_config: Dict[str, Any],
-        containers_data: Dict[str, Dict[str, Any]]
+        containers_data: Dict[str, Dict[str, Any]],
+        metrics: Optional[Dict[str, float]] = None
     ) -> None:
         """Process scaling decisions for a single group.
         
@@ -59,6 +69,7 @@ class HorizontalScaler:
             group_name: Name of the scaling group
             group_config: Group configuration
             containers_data: Container resource usage data
+            metrics: Precomputed group metrics; calculated here if None
         """
         current_time = datetime.now()
         last_action_time = self.scale_last_action.get(
@@ -78,8 +89,9 @@ class HorizontalScaler:
             })
             return
         
-        # Calculate group metrics
-        metrics = self.metrics_calculator.calculate_group_metrics(group_containers, containers_data)
+        # Calculate group metrics unless the caller already did
+        if metrics is None:
+            metrics = self.metrics_calculator.calculate_group_metrics(group_containers, containers_data)
         self._log_scaling_event(group_name, 'group_metrics', metrics)
         
         # Make scaling decisions
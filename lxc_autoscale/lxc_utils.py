@@ -7,7 +7,6 @@ removing all SSH dependencies for improved reliability and performance.
 import json
 import logging
 import os
-import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
@@ -199,10 +198,13 @@ def get_total_cores() -> int:
     if not PROXMOX_API_AVAILABLE:
         logging.warning("Proxmox API not available. Using local system information.")
         try:
-            total_cores = int(subprocess.check_output("nproc", shell=True).decode().strip())
-        except subprocess.CalledProcessError:
-            logging.error("Failed to get local CPU core count")
-            return 1
+            # Affinity-aware core count, equivalent to nproc without a fork/exec
+            total_cores = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            total_cores = os.cpu_count()
+            if not total_cores:
+                logging.error("Failed to get local CPU core count")
+                return 1
     else:
         try:
             client = get_proxmox_client()
@@ -232,9 +234,8 @@ def get_total_memory() -> int:
     if not PROXMOX_API_AVAILABLE:
         logging.warning("Proxmox API not available. Using local system information.")
         try:
-            output = subprocess.check_output("free -m | awk '/^Mem:/ {print $2}'", shell=True)
-            total_memory = int(output.decode().strip())
-        except (subprocess.CalledProcessError, ValueError):
+            total_memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+        except (AttributeError, OSError, ValueError):
             logging.error("Failed to get local memory information")
             return 2048  # Default fallback
     else:
@@ -1,10 +1,11 @@
 """Main entry point for high-performance async LXC autoscaling."""
 
 import asyncio
+import gc
 import logging
 import signal
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import time
 
 from async_scaling_orchestrator import AsyncScalingOrchestrator
@@ -23,6 +24,8 @@ class AsyncLXCAutoscaler:
         self.async_utils = None
         self.running = False
         self.shutdown_event = asyncio.Event()
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._collect_future: Optional[asyncio.Future] = None
         
     async def initialize(self) -> None:
         """Initialize the autoscaler and its components."""
@@ -30,6 +33,9 @@ class AsyncLXCAutoscaler:
             # Setup structured logging
             setup_structured_logging()
             
+            # Setup signal handlers for graceful shutdown
+            self._setup_signal_handlers()
+            
             # Initialize async LXC utilities
             self.async_utils = get_async_lxc_utils()
             
@@ -45,6 +51,9 @@ class AsyncLXCAutoscaler:
             if not is_ready:
                 raise RuntimeError("System readiness validation failed")
             
+            # Move long-lived config/orchestrator state out of future GC scans
+            gc.freeze()
+            
             logging.info("Async LXC autoscaler initialized successfully")
             
         except Exception as e:
@@ -54,6 +63,21 @@ class AsyncLXCAutoscaler:
     async def collect_container_data_async(self) -> Dict[str, Dict[str, Any]]:
         """Collect container data asynchronously.
         
+        Concurrent callers share a single in-flight collection instead of
+        each starting their own.
+        
+        Returns:
+            Dictionary containing container resource usage data
+        """
+        if self._collect_future is None or self._collect_future.done():
+            self._collect_future = asyncio.ensure_future(self._collect_container_data())
+        
+        # Shield so a cancelled caller does not cancel the shared collection
+        return await asyncio.shield(self._collect_future)
+    
+    async def _collect_container_data(self) -> Dict[str, Dict[str, Any]]:
+        """Run a single container data collection.
+        
         Returns:
             Dictionary containing container resource usage data
         """
@@ -79,7 +103,7 @@ class AsyncLXCAutoscaler:
         Returns:
             Dictionary containing cycle results
         """
-        cycle_start = time.time()
+        cycle_start = time.monotonic()
         
         try:
             # Collect container data
@@ -100,13 +124,13 @@ class AsyncLXCAutoscaler:
                 containers_data, energy_mode
             )
             
-            cycle_duration = time.time() - cycle_start
+            cycle_duration = time.monotonic() - cycle_start
             logging.info(f"Scaling cycle completed in {cycle_duration:.2f}s")
             
             return results
             
         except Exception as e:
-            cycle_duration = time.time() - cycle_start
+            cycle_duration = time.monotonic() - cycle_start
             logging.error(f"Error in scaling cycle (duration: {cycle_duration:.2f}s): {e}")
             return {'success': False, 'error': str(e), 'duration': cycle_duration}
     
@@ -119,10 +143,15 @@ class AsyncLXCAutoscaler:
         self.running = True
         cycle_count = 0
         
+        # Cycles are scheduled on a monotonic grid so wall-clock adjustments
+        # cannot cause skew or back-to-back runs
+        next_deadline = time.monotonic()
+        
         try:
             while self.running and not self.shutdown_event.is_set():
-                cycle_start = time.time()
+                cycle_start = time.monotonic()
                 cycle_count += 1
+                next_deadline += poll_interval
                 
                 logging.info(f"Starting scaling cycle #{cycle_count}")
                 
@@ -140,10 +169,14 @@ class AsyncLXCAutoscaler:
                     await self._log_performance_statistics()
                 
                 # Calculate time until next cycle
-                cycle_duration = time.time() - cycle_start
-                sleep_time = max(0, poll_interval - cycle_duration)
+                now = time.monotonic()
+                sleep_time = max(0, next_deadline - now)
                 
                 if sleep_time > 0:
+                    # Collect the young generations while idle so per-cycle
+                    # temporaries do not pile up into a full-heap collection
+                    gc.collect(1)
+                    
                     logging.info(f"Waiting {sleep_time:.1f}s until next cycle")
                     try:
                         await asyncio.wait_for(
@@ -154,7 +187,10 @@ class AsyncLXCAutoscaler:
                     except asyncio.TimeoutError:
                         pass  # Normal timeout, continue to next cycle
                 else:
+                    cycle_duration = now - cycle_start
                     logging.warning(f"Cycle took longer than poll interval ({cycle_duration:.1f}s > {poll_interval}s)")
+                    # Re-anchor the schedule instead of running missed cycles back-to-back
+                    next_deadline = now
                     
         except asyncio.CancelledError:
             logging.info("Continuous autoscaling cancelled")
@@ -190,13 +226,20 @@ class AsyncLXCAutoscaler:
         logging.info("Async autoscaler shutdown completed")
     
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
+        """Setup signal handlers for graceful shutdown.
+        
+        Handlers are registered on the running event loop so the shutdown
+        task is always scheduled from the loop thread.
+        """
+        loop = asyncio.get_running_loop()
+        
+        def signal_handler(signum: int) -> None:
             logging.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.shutdown())
+            if self._shutdown_task is None:
+                self._shutdown_task = asyncio.create_task(self.shutdown())
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, signal_handler, signum)
 
 
 async def main() -> int:
@@ -207,9 +250,6 @@ async def main() -> int:
         # Initialize the autoscaler
         await autoscaler.initialize()
         
-        # Setup signal handlers
-        autoscaler._setup_signal_handlers()
-        
         # Check if running in single-cycle mode
         if len(sys.argv) > 1 and sys.argv[1] == '--single-cycle':
             logging.info("Running in single-cycle mode")
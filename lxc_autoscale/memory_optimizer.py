@@ -7,17 +7,27 @@ import psutil
 import logging
 import asyncio
 import weakref
-from typing import Any, Dict, List, Optional, Callable, Set
+from typing import Any, Deque, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from functools import lru_cache, wraps
 import tracemalloc
 import linecache
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _get_source_line(filename: str, line_no: int) -> str:
+    """Read a source line, memoized so repeated hotspots avoid file I/O.
+    
+    Kept separate from linecache so _clear_internal_caches does not drop it.
+    """
+    return linecache.getline(filename, line_no)
+
+
+@dataclass(slots=True)
 class MemorySnapshot:
     """Memory usage snapshot."""
     timestamp: float
@@ -26,9 +36,11 @@ class MemorySnapshot:
     gc_objects: int
     gc_collections: List[int]
     top_allocations: List[tuple] = field(default_factory=list)
+    # Only full snapshots walk gc.get_objects(); cheap ones record 0
+    full: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryStats:
     """Memory statistics and metrics."""
     peak_memory_mb: float = 0.0
@@ -43,20 +55,33 @@ class MemoryStats:
 class MemoryProfiler:
     """Advanced memory profiler for tracking usage and leaks."""
     
-    def __init__(self, enable_tracemalloc: bool = True):
+    def __init__(self, enable_tracemalloc: bool = True, max_snapshots: int = 1024):
         """Initialize memory profiler.
         
         Args:
             enable_tracemalloc: Enable Python's tracemalloc for detailed tracking
+            max_snapshots: Maximum number of snapshots retained for leak detection
         """
         self.enable_tracemalloc = enable_tracemalloc
         self.process = psutil.Process()
-        self.snapshots: List[MemorySnapshot] = []
+        self.snapshots: Deque[MemorySnapshot] = deque(maxlen=max_snapshots)
         self.baseline_memory = 0.0
         self.peak_memory = 0.0
-        self._tracking_enabled = False
-        self._tracked_objects: Set[weakref.ref] = set()
-        self._lock = threading.RLock()
+        # Snapshots live in a deque (thread-safe appends), so only the
+        # tracking flag needs synchronisation
+        self._tracking = threading.Event()
+        self._tracked_objects: weakref.WeakSet = weakref.WeakSet()
+        
+        # Decorated calls use cheap snapshots and only escalate to a full
+        # tracemalloc snapshot every N calls or on a large RSS change
+        self.full_snapshot_interval = 100
+        self.full_snapshot_rss_delta_mb = 10.0
+        self._profiled_calls = 0
+        
+        # Reuse the top tracemalloc statistics for back-to-back reporting; the
+        # snapshot itself is dropped as soon as they are derived
+        self.tracemalloc_snapshot_ttl = 5.0
+        self._tm_statistics: Dict[Tuple[str, int], Tuple[float, List[tracemalloc.Statistic]]] = {}
         
         if enable_tracemalloc and not tracemalloc.is_tracing():
             tracemalloc.start(10)  # Keep top 10 frames
@@ -64,27 +89,30 @@ class MemoryProfiler:
         else:
             logging.info("Memory profiler initialized without tracemalloc")
     
+    @property
+    def _tracking_enabled(self) -> bool:
+        """Whether snapshots are currently being recorded."""
+        return self._tracking.is_set()
+    
     def start_tracking(self) -> None:
         """Start memory tracking."""
-        with self._lock:
-            self._tracking_enabled = True
-            self.baseline_memory = self._get_current_memory()
-            self.peak_memory = self.baseline_memory
-            
-            # Take initial snapshot
-            self._take_snapshot()
-            logging.info(f"Memory tracking started. Baseline: {self.baseline_memory:.2f} MB")
+        self.baseline_memory = self._get_current_memory()
+        self.peak_memory = self.baseline_memory
+        self._tracking.set()
+        
+        # Take initial snapshot
+        self._full_snapshot()
+        logging.info(f"Memory tracking started. Baseline: {self.baseline_memory:.2f} MB")
     
     def stop_tracking(self) -> None:
         """Stop memory tracking."""
-        with self._lock:
-            self._tracking_enabled = False
-            
-            # Take final snapshot
-            if self.snapshots:
-                self._take_snapshot()
-            
-            logging.info("Memory tracking stopped")
+        # Take final snapshot while still recording
+        if self.snapshots:
+            self._full_snapshot()
+        
+        self._tracking.clear()
+        self.clear_statistics_cache()
+        logging.info("Memory tracking stopped")
     
     def _get_current_memory(self) -> float:
         """Get current process memory usage in MB."""
@@ -95,12 +123,50 @@ class MemoryProfiler:
             logging.error(f"Error getting memory info: {e}")
             return 0.0
     
-    def _take_snapshot(self) -> MemorySnapshot:
-        """Take a memory usage snapshot."""
+    def _get_tracemalloc_statistics(self, key_type: str, limit: int) -> List[tracemalloc.Statistic]:
+        """Get the top tracemalloc statistics, reusing recent results.
+        
+        Only the top entries are cached, for at most tracemalloc_snapshot_ttl
+        seconds; the snapshot they were taken from is not kept.
+        
+        Args:
+            key_type: Statistics grouping ('lineno', 'filename', ...)
+            limit: Number of largest statistics to return
+            
+        Returns:
+            Statistics sorted by size, largest first
+        """
+        now = time.monotonic()
+        ttl = self.tracemalloc_snapshot_ttl
+        
+        # Evict expired results lazily so nothing outlives the TTL for long
+        for cache_key, (taken_at, _) in list(self._tm_statistics.items()):
+            if now - taken_at > ttl:
+                del self._tm_statistics[cache_key]
+        
+        cached = self._tm_statistics.get((key_type, limit))
+        if cached is not None:
+            return cached[1]
+        
+        statistics = tracemalloc.take_snapshot().statistics(key_type)[:limit]
+        # Stamp after the snapshot, which can take seconds on large heaps
+        self._tm_statistics[(key_type, limit)] = (time.monotonic(), statistics)
+        return statistics
+    
+    def clear_statistics_cache(self) -> None:
+        """Drop cached tracemalloc statistics."""
+        self._tm_statistics.clear()
+    
+    def _cheap_snapshot(self, full: bool = False) -> MemorySnapshot:
+        """Take a lightweight snapshot (RSS and GC counters only).
+        
+        Args:
+            full: Also count GC-tracked objects, which walks every object
+        """
         try:
             current_memory = self._get_current_memory()
             system_memory = psutil.virtual_memory().percent
-            gc_objects = len(gc.get_objects())
+            gc_objects = len(gc.get_objects()) if full else 0
             gc_stats = gc.get_stats()
             gc_collections = [stat['collections'] for stat in gc_stats]
             
@@ -108,27 +174,13 @@ class MemoryProfiler:
             if current_memory > self.peak_memory:
                 self.peak_memory = current_memory
             
-            # Get top allocations if tracemalloc is enabled
-            top_allocations = []
-            if self.enable_tracemalloc and tracemalloc.is_tracing():
-                snapshot = tracemalloc.take_snapshot()
-                top_stats = snapshot.statistics('lineno')[:10]  # Top 10
-                
-                for stat in top_stats:
-                    filename = stat.traceback.format()[-1]
-                    top_allocations.append((
-                        filename,
-                        stat.size / 1024 / 1024,  # Size in MB
-                        stat.count
-                    ))
-            
             snapshot = MemorySnapshot(
                 timestamp=time.time(),
                 process_memory_mb=current_memory,
                 system_memory_percent=system_memory,
                 gc_objects=gc_objects,
                 gc_collections=gc_collections,
-                top_allocations=top_allocations
+                full=full
             )
             
             if self._tracking_enabled:
@@ -146,6 +198,42 @@ class MemoryProfiler:
                 gc_collections=[]
             )
     
+    def _full_snapshot(self) -> MemorySnapshot:
+        """Take a memory usage snapshot including tracemalloc allocations."""
+        snapshot = self._cheap_snapshot(full=True)
+        
+        # Get top allocations if tracemalloc is enabled
+        if self.enable_tracemalloc and tracemalloc.is_tracing():
+            try:
+                top_stats = self._get_tracemalloc_statistics('lineno', 10)  # Top 10
+                
+                for stat in top_stats:
+                    filename = stat.traceback.format()[-1]
+                    snapshot.top_allocations.append((
+                        filename,
+                        stat.size / 1024 / 1024,  # Size in MB
+                        stat.count
+                    ))
+            except Exception as e:
+                logging.error(f"Error collecting tracemalloc statistics: {e}")
+        
+        return snapshot
+    
+    def _should_take_full_snapshot(self, memory_diff_mb: float) -> bool:
+        """Decide whether a profiled call should escalate to a full snapshot.
+        
+        Args:
+            memory_diff_mb: RSS change observed across the profiled call
+            
+        Returns:
+            True on every Nth profiled call or when the RSS change is large
+        """
+        self._profiled_calls += 1
+        return (
+            abs(memory_diff_mb) > self.full_snapshot_rss_delta_mb or
+            self._profiled_calls % self.full_snapshot_interval == 0
+        )
+    
     def get_current_stats(self) -> MemoryStats:
         """Get current memory statistics."""
         current_memory = self._get_current_memory()
@@ -155,15 +243,10 @@ class MemoryProfiler:
         gc_stats = gc.get_stats()
         total_collections = sum(stat['collections'] for stat in gc_stats)
         
-        # Count tracked objects
-        # Clean up dead references
-        self._tracked_objects = {ref for ref in self._tracked_objects if ref() is not None}
-        
         # Get allocation hotspots
         hotspots = {}
         if self.enable_tracemalloc and tracemalloc.is_tracing():
-            snapshot = tracemalloc.take_snapshot()
-            top_stats = snapshot.statistics('filename')[:5]
+            top_stats = self._get_tracemalloc_statistics('filename', 5)
             
             for stat in top_stats:
                 filename = os.path.basename(stat.traceback.format()[-1].split(':')[0])
@@ -181,20 +264,20 @@ class MemoryProfiler:
     
     def _count_potential_leaks(self) -> int:
         """Count potential memory leaks based on object growth."""
-        if len(self.snapshots) < 2:
+        # Object counts are only collected in full snapshots; compare the
+        # oldest and latest full snapshots still retained
+        first_snapshot = next((s for s in self.snapshots if s.full), None)
+        last_snapshot = next((s for s in reversed(self.snapshots) if s.full), None)
+        if first_snapshot is None or first_snapshot is last_snapshot:
             return 0
         
-        # Compare object counts between first and last snapshots
-        first_snapshot = self.snapshots[0]
-        last_snapshot = self.snapshots[-1]
-        
         object_growth = last_snapshot.gc_objects - first_snapshot.gc_objects
         
         # Threshold for considering objects as potential leaks
         # This is a heuristic - significant growth might indicate leaks
         leak_threshold = max(1000, first_snapshot.gc_objects * 0.1)  # 10% growth or 1000 objects
         
-        return max(0, object_growth - leak_threshold)
+        return max(0, int(object_growth - leak_threshold))
     
     def track_object(self, obj: Any) -> None:
         """Track a specific object for memory leak detection.
@@ -203,8 +286,7 @@ class MemoryProfiler:
             obj: Object to track
         """
         try:
-            ref = weakref.ref(obj)
-            self._tracked_objects.add(ref)
+            self._tracked_objects.add(obj)
         except TypeError:
             # Object doesn't support weak references
             pass
@@ -292,18 +374,17 @@ class MemoryProfiler:
             return []
         
         try:
-            snapshot = tracemalloc.take_snapshot()
-            top_stats = snapshot.statistics('lineno')[:limit]
+            top_stats = self._get_tracemalloc_statistics('lineno', limit)
             
             results = []
             for stat in top_stats:
                 # Get the line content
-                frame = stat.traceback.format()[-1]
-                filename, line_no = frame.split(':')[:2]
+                frame = stat.traceback[-1]
+                filename, line_no = frame.filename, frame.lineno
                 
                 try:
-                    line_content = linecache.getline(filename, int(line_no)).strip()
-                except:
+                    line_content = _get_source_line(filename, line_no).strip()
+                except Exception:
                     line_content = "Unable to read line"
                 
                 results.append({
@@ -333,6 +414,14 @@ class MemoryOptimizer:
         self.profiler = profiler
         self.optimization_enabled = True
         self.auto_gc_threshold = 100.0  # MB
+        
+        # Adaptive polling: shrink the interval on memory growth, grow it
+        # after several stable checks
+        self.min_check_interval = 5.0
+        self.max_check_interval = 600.0
+        self.growth_threshold_percent = 5.0
+        self.stable_threshold_percent = 1.0
+        self.stable_checks_before_backoff = 3
         self.optimization_stats = {
             'optimizations_performed': 0,
             'memory_freed_mb': 0.0,
@@ -360,10 +449,6 @@ class MemoryOptimizer:
             self._clear_internal_caches()
             optimizations_applied.append('cache_clearing')
             
-            # Optimize data structures
-            await self._optimize_data_structures()
-            optimizations_applied.append('data_structure_optimization')
-            
             # Final memory measurement
             end_memory = self.profiler._get_current_memory()
             memory_freed = start_memory - end_memory
@@ -400,6 +485,9 @@ class MemoryOptimizer:
             cache = get_global_cache()
             cache.clear()
             
+            # Drop cached tracemalloc statistics
+            self.profiler.clear_statistics_cache()
+            
             # Clear linecache
             linecache.clearcache()
             
@@ -410,34 +498,24 @@ class MemoryOptimizer:
         except Exception as e:
             logging.error(f"Error clearing internal caches: {e}")
     
-    async def _optimize_data_structures(self) -> None:
-        """Optimize data structures in memory."""
-        try:
-            # This is a placeholder for data structure optimizations
-            # In practice, this would analyze and optimize specific data structures
-            
-            # Example optimizations:
-            # - Convert large lists to generators where possible
-            # - Use __slots__ for classes with many instances
-            # - Compress stored data
-            # - Remove duplicate objects
-            
-            await asyncio.sleep(0.01)  # Small delay to yield control
-            
-        except Exception as e:
-            logging.error(f"Error optimizing data structures: {e}")
-    
     async def monitor_and_optimize(self, check_interval: float = 60.0) -> None:
         """Monitor memory usage and optimize automatically.
         
+        The interval adapts between min_check_interval and max_check_interval:
+        it is halved when memory grows and doubled after stable checks.
+        
         Args:
-            check_interval: Interval between checks in seconds
+            check_interval: Initial interval between checks in seconds
         """
         logging.info(f"Starting automatic memory monitoring (interval: {check_interval}s)")
         
+        interval = check_interval
+        previous_memory = self.profiler._get_current_memory()
+        stable_checks = 0
+        
         try:
             while self.optimization_enabled:
-                await asyncio.sleep(check_interval)
+                await asyncio.sleep(interval)
                 
                 current_memory = self.profiler._get_current_memory()
                 
@@ -448,11 +526,56 @@ class MemoryOptimizer:
                     self.optimization_stats['auto_gc_triggers'] += 1
                     await self.optimize_memory_usage()
                 
+                interval, stable_checks = self._next_check_interval(
+                    interval, previous_memory, current_memory, stable_checks
+                )
+                previous_memory = current_memory
+                
         except asyncio.CancelledError:
             logging.info("Memory monitoring cancelled")
         except Exception as e:
             logging.error(f"Error in memory monitoring: {e}")
     
+    def _next_check_interval(
+        self,
+        interval: float,
+        previous_memory: float,
+        current_memory: float,
+        stable_checks: int
+    ) -> Tuple[float, int]:
+        """Compute the next monitoring interval from the observed memory change.
+        
+        Args:
+            interval: Current check interval in seconds
+            previous_memory: Memory usage at the previous check in MB
+            current_memory: Memory usage at this check in MB
+            stable_checks: Number of consecutive stable checks so far
+            
+        Returns:
+            Tuple of (next interval in seconds, updated stable check count)
+        """
+        if previous_memory <= 0:
+            return interval, 0
+        
+        change_percent = (current_memory - previous_memory) / previous_memory * 100
+        
+        if change_percent > self.growth_threshold_percent:
+            new_interval = max(self.min_check_interval, interval / 2)
+            if new_interval != interval:
+                logging.debug(f"Memory grew {change_percent:.1f}%, checking every {new_interval:.0f}s")
+            return new_interval, 0
+        
+        if abs(change_percent) < self.stable_threshold_percent:
+            stable_checks += 1
+            if stable_checks >= self.stable_checks_before_backoff:
+                new_interval = min(self.max_check_interval, interval * 2)
+                if new_interval != interval:
+                    logging.debug(f"Memory stable, checking every {new_interval:.0f}s")
+                return new_interval, 0
+            return interval, stable_checks
+        
+        return interval, 0
+    
     def get_optimization_stats(self) -> Dict[str, Any]:
         """Get memory optimization statistics."""
         return self.optimization_stats.copy()
@@ -474,22 +597,31 @@ def get_memory_optimizer() -> MemoryOptimizer:
 
 
 def memory_profile(func: Callable) -> Callable:
-    """Decorator for profiling memory usage of functions."""
+    """Decorator for profiling memory usage of functions.
+    
+    Profiling only happens while the global profiler is tracking; otherwise
+    the wrapped function is called directly.
+    """
+    @wraps(func)
     def wrapper(*args, **kwargs):
         profiler = get_memory_profiler()
+        if not profiler._tracking_enabled:
+            return func(*args, **kwargs)
         
         # Take snapshot before
-        before_snapshot = profiler._take_snapshot()
+        before_snapshot = profiler._cheap_snapshot()
         
         try:
             result = func(*args, **kwargs)
             return result
         finally:
             # Take snapshot after
-            after_snapshot = profiler._take_snapshot()
+            after_snapshot = profiler._cheap_snapshot()
             
             # Log memory usage
             memory_diff = after_snapshot.process_memory_mb - before_snapshot.process_memory_mb
+            if profiler._should_take_full_snapshot(memory_diff):
+                profiler._full_snapshot()
             if abs(memory_diff) > 0.1:  # Only log if significant change
                 logging.info(f"Function {func.__name__} memory change: {memory_diff:+.2f} MB")
     
@@ -1,8 +1,9 @@
 """Metrics calculation utilities for container scaling decisions."""
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Tuple
+import time
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Tuple
 
 from constants import (
     AGGRESSIVE_MULTIPLIER, BEHAVIOR_AGGRESSIVE, BEHAVIOR_CONSERVATIVE,
@@ -10,9 +11,51 @@ from constants import (
 )
 
 
+# Base scaling multiplier for each behaviour mode (normal is 1.0)
+BEHAVIOR_MULTIPLIERS = {
+    BEHAVIOR_CONSERVATIVE: CONSERVATIVE_MULTIPLIER,
+    BEHAVIOR_AGGRESSIVE: AGGRESSIVE_MULTIPLIER
+}
+
+# Seconds an is_off_peak() result is reused before re-reading the clock
+OFF_PEAK_CACHE_SECONDS = 30.0
+
+# Extracts cpu_usage from history points in C rather than a Python generator
+_get_cpu_usage = itemgetter('cpu_usage')
+
+
+def _welford(values: Iterable[float]) -> Tuple[int, float, float]:
+    """Compute count, mean and sum of squared deviations in one pass.
+    
+    Uses Welford's online algorithm, which is numerically stable and needs
+    no intermediate list.
+    
+    Args:
+        values: Sample values
+        
+    Returns:
+        Tuple of (count, mean, m2) where variance is m2 / count
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values:
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+    return count, mean, m2
+
+
 class MetricsCalculator:
     """Handles calculation of scaling metrics and thresholds."""
     
+    __slots__ = (
+        'config_manager', '_cpu_scale_divisor', '_off_peak_start', '_off_peak_end',
+        '_cpu_lower_threshold', '_cpu_upper_threshold', '_base_multiplier',
+        '_off_peak_pred', '_off_peak_checked_at', '_off_peak_cached'
+    )
+    
     def __init__(self, config_manager):
         """Initialize metrics calculator.
         
@@ -20,6 +63,32 @@ class MetricsCalculator:
             config_manager: Configuration manager instance
         """
         self.config_manager = config_manager
+        self.invalidate()
+        config_manager.register_reload_callback(self.invalidate)
+    
+    def invalidate(self) -> None:
+        """Refresh configuration values cached for the scaling hot path.
+        
+        Called on construction and whenever the configuration is reloaded.
+        """
+        get_default = self.config_manager.get_default
+        self._cpu_scale_divisor = get_default('cpu_scale_divisor', DEFAULT_CPU_SCALE_DIVISOR)
+        self._off_peak_start = get_default('off_peak_start', 22)
+        self._off_peak_end = get_default('off_peak_end', 6)
+        self._cpu_lower_threshold = get_default('cpu_lower_threshold', 20)
+        self._cpu_upper_threshold = get_default('cpu_upper_threshold', 80)
+        
+        # Specialize behaviour and off-peak window once per configuration
+        self._base_multiplier = BEHAVIOR_MULTIPLIERS.get(get_default('behaviour', 'normal'), 1.0)
+        start, end = self._off_peak_start, self._off_peak_end
+        if start < end:
+            self._off_peak_pred = lambda hour: start <= hour < end
+        else:
+            self._off_peak_pred = lambda hour: hour >= start or hour < end
+        
+        # Off-peak status only changes on hour boundaries; memoize it briefly
+        self._off_peak_checked_at = float('-inf')
+        self._off_peak_cached = False
     
     def calculate_increment(
         self,
@@ -39,15 +108,19 @@ class MetricsCalculator:
         Returns:
             Calculated increment value
         """
-        cpu_scale_divisor = self.config_manager.get_default('cpu_scale_divisor', DEFAULT_CPU_SCALE_DIVISOR)
-        proportional_increment = int((current - upper_threshold) / cpu_scale_divisor)
+        proportional_increment = int((current - upper_threshold) / self._cpu_scale_divisor)
         
-        calculated_increment = min(max(min_increment, proportional_increment), max_increment)
+        # Inline clamp; same result as min(max(min_increment, x), max_increment)
+        calculated_increment = proportional_increment
+        if calculated_increment < min_increment:
+            calculated_increment = min_increment
+        if calculated_increment > max_increment:
+            calculated_increment = max_increment
         
         logging.debug(
-            f"Calculated increment: {calculated_increment} "
-            f"(current: {current}, upper_threshold: {upper_threshold}, "
-            f"min_increment: {min_increment}, max_increment: {max_increment})"
+            "Calculated increment: %s (current: %s, upper_threshold: %s, "
+            "min_increment: %s, max_increment: %s)",
+            calculated_increment, current, upper_threshold, min_increment, max_increment
         )
         
         return calculated_increment
@@ -72,18 +145,23 @@ class MetricsCalculator:
         Returns:
             Calculated decrement value
         """
-        cpu_scale_divisor = self.config_manager.get_default('cpu_scale_divisor', DEFAULT_CPU_SCALE_DIVISOR)
-        dynamic_decrement = max(1, int((lower_threshold - current) / cpu_scale_divisor))
+        dynamic_decrement = int((lower_threshold - current) / self._cpu_scale_divisor)
+        if dynamic_decrement < 1:
+            dynamic_decrement = 1
         
         # Ensure we don't go below minimum allocated resources
         max_possible_decrement = current_allocated - min_allocated
-        calculated_decrement = max(min(max_possible_decrement, dynamic_decrement), min_decrement)
+        calculated_decrement = dynamic_decrement
+        if calculated_decrement > max_possible_decrement:
+            calculated_decrement = max_possible_decrement
+        if calculated_decrement < min_decrement:
+            calculated_decrement = min_decrement
         
         logging.debug(
-            f"Calculated decrement: {calculated_decrement} "
-            f"(current: {current}, lower_threshold: {lower_threshold}, "
-            f"current_allocated: {current_allocated}, min_decrement: {min_decrement}, "
-            f"min_allocated: {min_allocated})"
+            "Calculated decrement: %s (current: %s, lower_threshold: %s, "
+            "current_allocated: %s, min_decrement: %s, min_allocated: %s)",
+            calculated_decrement, current, lower_threshold,
+            current_allocated, min_decrement, min_allocated
         )
         
         return calculated_decrement
@@ -94,20 +172,14 @@ class MetricsCalculator:
         Returns:
             The behavior multiplier with dynamic adjustment
         """
-        behavior = self.config_manager.get_default('behaviour', 'normal')
-        base_multiplier = 1.0
-        
-        if behavior == BEHAVIOR_CONSERVATIVE:
-            base_multiplier = CONSERVATIVE_MULTIPLIER
-        elif behavior == BEHAVIOR_AGGRESSIVE:
-            base_multiplier = AGGRESSIVE_MULTIPLIER
+        multiplier = self._base_multiplier
         
         # Apply time-based adjustment for off-peak hours
         if self.is_off_peak():
-            base_multiplier *= OFF_PEAK_MULTIPLIER
+            multiplier *= OFF_PEAK_MULTIPLIER
         
-        logging.debug(f"Behavior multiplier set to {base_multiplier} based on configuration and time")
-        return base_multiplier
+        logging.debug("Behavior multiplier set to %s based on configuration and time", multiplier)
+        return multiplier
     
     def is_off_peak(self) -> bool:
         """Determine if the current time is within off-peak hours.
@@ -115,16 +187,21 @@ class MetricsCalculator:
         Returns:
             True if it is off-peak, otherwise False
         """
-        current_hour = datetime.now().hour
-        start = self.config_manager.get_default('off_peak_start', 22)
-        end = self.config_manager.get_default('off_peak_end', 6)
+        now = time.monotonic()
+        if now - self._off_peak_checked_at < OFF_PEAK_CACHE_SECONDS:
+            return self._off_peak_cached
         
-        logging.debug(f"Current hour: {current_hour}, Off-peak hours: {start} - {end}")
+        current_hour = time.localtime().tm_hour
+        off_peak = self._off_peak_pred(current_hour)
         
-        if start < end:
-            return start <= current_hour < end
-        else:
-            return current_hour >= start or current_hour < end
+        logging.debug(
+            "Current hour: %s, Off-peak hours: %s - %s",
+            current_hour, self._off_peak_start, self._off_peak_end
+        )
+        
+        self._off_peak_checked_at = now
+        self._off_peak_cached = off_peak
+        return off_peak
     
     def calculate_dynamic_thresholds(
         self,
@@ -139,28 +216,24 @@ class MetricsCalculator:
             Tuple containing dynamic lower and upper thresholds
         """
         if not container_history:
-            return (
-                self.config_manager.get_default('cpu_lower_threshold', 20),
-                self.config_manager.get_default('cpu_upper_threshold', 80)
-            )
+            return self._cpu_lower_threshold, self._cpu_upper_threshold
         
-        usage_values = [point['cpu_usage'] for point in container_history]
-        avg_usage = sum(usage_values) / len(usage_values)
+        count, avg_usage, m2 = _welford(map(_get_cpu_usage, container_history))
         
         # Calculate standard deviation
-        variance = sum((x - avg_usage) ** 2 for x in usage_values) / len(usage_values)
+        variance = m2 / count
         std_dev = variance ** 0.5
         
         # Calculate dynamic thresholds
-        default_lower = self.config_manager.get_default('cpu_lower_threshold', 20)
-        default_upper = self.config_manager.get_default('cpu_upper_threshold', 80)
+        default_lower = self._cpu_lower_threshold
+        default_upper = self._cpu_upper_threshold
         
         dynamic_lower = max(default_lower, avg_usage - std_dev)
         dynamic_upper = min(default_upper, avg_usage + std_dev * 1.5)
         
         logging.debug(
-            f"Dynamic thresholds calculated: lower={dynamic_lower:.2f}, upper={dynamic_upper:.2f} "
-            f"(avg_usage={avg_usage:.2f}, std_dev={std_dev:.2f})"
+            "Dynamic thresholds calculated: lower=%.2f, upper=%.2f (avg_usage=%.2f, std_dev=%.2f)",
+            dynamic_lower, dynamic_upper, avg_usage, std_dev
         )
         
         return dynamic_lower, dynamic_upper
@@ -179,32 +252,15 @@ class MetricsCalculator:
         Returns:
             Dictionary containing group metrics
         """
-        if not group_containers:
-            return {
-                'avg_cpu_usage': 0.0,
-                'avg_mem_usage': 0.0,
-                'total_containers': 0
-            }
-        
-        total_cpu = sum(containers_data[ctid]['cpu'] for ctid in group_containers if ctid in containers_data)
-        total_mem = sum(containers_data[ctid]['mem'] for ctid in group_containers if ctid in containers_data)
-        num_containers = len([ctid for ctid in group_containers if ctid in containers_data])
-        
-        if num_containers == 0:
-            return {
-                'avg_cpu_usage': 0.0,
-                'avg_mem_usage': 0.0,
-                'total_containers': 0
-            }
-        
-        metrics = {
-            'avg_cpu_usage': total_cpu / num_containers,
-            'avg_mem_usage': total_mem / num_containers,
-            'total_containers': num_containers
-        }
+        # Filter to containers with data via C-level dict-view intersection
+        valid = containers_data.keys() & group_containers
+        total_cpu = total_mem = 0.0
+        for ctid in valid:
+            data = containers_data[ctid]
+            total_cpu += data['cpu']
+            total_mem += data['mem']
         
-        logging.debug(f"Group metrics calculated: {metrics}")
-        return metrics
+        return self._group_metrics(total_cpu, total_mem, len(valid))
     
     def calculate_resource_utilization(
         self,
@@ -218,21 +274,103 @@ class MetricsCalculator:
         Returns:
             Dictionary containing utilization metrics for each container
         """
+        return {
+            ctid: self.calculate_container_utilization(data)
+            for ctid, data in containers_data.items()
+        }
+    
+    def compute_all(
+        self,
+        containers_data: Dict[str, Dict[str, Any]],
+        groups: Dict[str, List[str]]
+    ) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]]]:
+        """Calculate per-container utilization and group metrics in one pass.
+        
+        Args:
+            containers_data: Container resource usage data
+            groups: Mapping of group name to the container IDs in that group
+            
+        Returns:
+            Tuple of (utilization metrics by container, group metrics by group)
+        """
+        # Invert the group index so each container is visited only once;
+        # duplicates within a group count once, as in calculate_group_metrics
+        container_groups: Dict[str, List[str]] = {}
+        for group_name, group_containers in groups.items():
+            for ctid in set(group_containers):
+                container_groups.setdefault(ctid, []).append(group_name)
+        
+        group_totals = {group_name: [0.0, 0.0, 0] for group_name in groups}
         utilization_metrics = {}
         
         for ctid, data in containers_data.items():
-            cpu_usage = data.get('cpu', 0)
-            mem_usage = data.get('mem', 0)
-            total_memory = data.get('initial_memory', 1)  # Avoid division by zero
-            total_cores = data.get('initial_cores', 1)
+            utilization_metrics[ctid] = self.calculate_container_utilization(data)
+            
+            for group_name in container_groups.get(ctid, ()):
+                totals = group_totals[group_name]
+                totals[0] += data['cpu']
+                totals[1] += data['mem']
+                totals[2] += 1
+        
+        group_metrics = {
+            group_name: self._group_metrics(*totals)
+            for group_name, totals in group_totals.items()
+        }
+        
+        return utilization_metrics, group_metrics
+    
+    @staticmethod
+    def calculate_container_utilization(data: Dict[str, Any]) -> Dict[str, float]:
+        """Calculate utilization metrics for a single container.
+        
+        Args:
+            data: Container resource usage data
+            
+        Returns:
+            Dictionary containing the container's utilization metrics
+        """
+        get = data.get
+        cpu_usage = get('cpu', 0)
+        mem_usage = get('mem', 0)
+        total_memory = get('initial_memory', 1)  # Avoid division by zero
+        total_cores = get('initial_cores', 1)
+        
+        # Divide once and derive both memory percentages from it
+        mem_percent = (mem_usage / total_memory) * 100
+        
+        return {
+            'cpu_utilization_percent': round(cpu_usage, 2),
+            'memory_utilization_percent': round(mem_percent, 2),
+            'memory_free_percent': round(100 - mem_percent, 2),
+            'cores_allocated': total_cores,
+            'memory_allocated_mb': total_memory,
+            'memory_used_mb': round(mem_usage, 2)
+        }
+    
+    @staticmethod
+    def _group_metrics(total_cpu: float, total_mem: float, num_containers: int) -> Dict[str, float]:
+        """Build group metrics from accumulated totals.
+        
+        Args:
+            total_cpu: Sum of CPU usage across the group
+            total_mem: Sum of memory usage across the group
+            num_containers: Number of containers with data in the group
             
-            utilization_metrics[ctid] = {
-                'cpu_utilization_percent': round(cpu_usage, 2),
-                'memory_utilization_percent': round((mem_usage / total_memory) * 100, 2),
-                'memory_free_percent': round(100 - ((mem_usage / total_memory) * 100), 2),
-                'cores_allocated': total_cores,
-                'memory_allocated_mb': total_memory,
-                'memory_used_mb': round(mem_usage, 2)
+        Returns:
+            Dictionary containing group metrics
+        """
+        if num_containers == 0:
+            return {
+                'avg_cpu_usage': 0.0,
+                'avg_mem_usage': 0.0,
+                'total_containers': 0
             }
         
-        return utilization_metrics
\ No newline at end of file
+        metrics = {
+            'avg_cpu_usage': total_cpu / num_containers,
+            'avg_mem_usage': total_mem / num_containers,
+            'total_containers': num_containers
+        }
+        
+        logging.debug("Group metrics calculated: %s", metrics)
+        return metrics
@@ -2,12 +2,13 @@
 
 import asyncio
 import logging
+import sys
 import time
-from typing import Any, Dict, List, Tuple, Optional, Set
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Tuple, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 import heapq
-from concurrent.futures import ThreadPoolExecutor
 
 from performance_cache import cached, get_global_cache
 from async_command_executor import AsyncCommandExecutor
@@ -26,7 +27,47 @@ class ScalingAction(Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class TierView:
+    """Tier configuration values used when planning scaling requests."""
+    cpu_upper: float
+    cpu_lower: float
+    min_cores: int
+    max_cores: int
+    core_min_inc: int
+    core_max_inc: int
+    mem_upper: float
+    mem_lower: float
+    min_memory: int
+    mem_min_inc: int
+    min_decrease_chunk: int
+    
+    @classmethod
+    def from_config(cls, tier_config: Dict[str, Any]) -> 'TierView':
+        """Build a view from a tier configuration dictionary.
+        
+        Args:
+            tier_config: Tier configuration
+            
+        Returns:
+            TierView with defaults applied for optional settings
+        """
+        return cls(
+            cpu_upper=tier_config['cpu_upper_threshold'],
+            cpu_lower=tier_config['cpu_lower_threshold'],
+            min_cores=tier_config['min_cores'],
+            max_cores=tier_config['max_cores'],
+            core_min_inc=tier_config.get('core_min_increment', 1),
+            core_max_inc=tier_config.get('core_max_increment', 2),
+            mem_upper=tier_config['memory_upper_threshold'],
+            mem_lower=tier_config['memory_lower_threshold'],
+            min_memory=tier_config['min_memory'],
+            mem_min_inc=tier_config.get('memory_min_increment', 256),
+            min_decrease_chunk=tier_config.get('min_decrease_chunk', 128)
+        )
+
+
+@dataclass(slots=True)
 class ResourceRequest:
     """Represents a resource scaling request."""
     container_id: str
@@ -36,11 +77,29 @@ class ResourceRequest:
     requested_value: int
     priority: float
     urgency: float
-    tier_config: Dict[str, Any]
-    
-    def __lt__(self, other):
-        """For priority queue ordering - higher priority/urgency first."""
-        return (self.priority * self.urgency) > (other.priority * other.urgency)
+    tier_config: TierView
+
+
+# Prebound pct set command templates (avoid re-parsing a format per request)
+_PCT_SET_CMD = "pct set {} {}".format
+_PCT_SET_OPTION = {
+    ResourceType.CPU: "-cores {}".format,
+    ResourceType.MEMORY: "-memory {}".format
+}
+
+
+def _request_score(request: ResourceRequest) -> float:
+    """Ordering key for resource requests - higher priority/urgency first."""
+    return request.priority * request.urgency
+
+
+# Hit/miss counts for the resource availability cache
+_availability_cache_events: Counter = Counter()
+
+
+def _record_availability_cache_event(event: str) -> None:
+    """Count a resource availability cache lookup ('hit' or 'miss')."""
+    _availability_cache_events[event] += 1
 
 
 class OptimizedResourceManager:
@@ -59,25 +118,36 @@ class OptimizedResourceManager:
         self.metrics_calculator = metrics_calculator
         self.cache = get_global_cache()
         
-        # Resource allocation tracking
-        self._resource_locks = {
-            ResourceType.CPU: asyncio.Lock(),
-            ResourceType.MEMORY: asyncio.Lock()
-        }
+        # Per-container tier views, rebuilt lazily after a config reload
+        self._tier_views: Dict[str, TierView] = {}
+        self._ignored_snapshot: FrozenSet[str] = frozenset()
+        self.invalidate()
+        config_manager.register_reload_callback(self.invalidate)
         
         # Performance metrics
         self._allocation_stats = {
             'total_requests': 0,
             'successful_allocations': 0,
             'failed_allocations': 0,
+            'failed_batches': 0,
+            'processing_runs': 0,
             'avg_allocation_time': 0.0,
+            'allocation_time_m2': 0.0,
+            'last_planning_time': 0.0,
             'resource_utilization': {'cpu': 0.0, 'memory': 0.0}
         }
+    
+    def invalidate(self) -> None:
+        """Refresh configuration-derived state used by request planning.
         
-        # Thread pool for CPU-intensive calculations
-        self._thread_pool = ThreadPoolExecutor(max_workers=4)
+        Called on construction and whenever the configuration is reloaded.
+        """
+        self._tier_views.clear()
+        self._ignored_snapshot = self.config_manager.get_ignored_containers()
+        # Commands per execution batch; batches are submitted concurrently
+        self._micro_batch_size = max(1, int(self.config_manager.get_default('micro_batch_size', 16)))
     
-    @cached(ttl=60.0, key_prefix="resource_availability_")
+    @cached(ttl=60.0, key_prefix="resource_availability_", metrics_sink=_record_availability_cache_event)
     async def get_available_resources(self) -> Tuple[int, int]:
         """Get available CPU cores and memory with caching.
         
@@ -87,10 +157,11 @@ class OptimizedResourceManager:
         # Import here to avoid circular imports
         from lxc_utils import get_total_cores, get_total_memory
         
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        total_cores = await loop.run_in_executor(self._thread_pool, get_total_cores)
-        total_memory = await loop.run_in_executor(self._thread_pool, get_total_memory)
+        # Run both lookups concurrently on the default executor to avoid blocking
+        total_cores, total_memory = await asyncio.gather(
+            asyncio.to_thread(get_total_cores),
+            asyncio.to_thread(get_total_memory)
+        )
         
         reserve_cpu_percent = self.config_manager.get_default('reserve_cpu_percent', 10)
         reserve_memory_mb = self.config_manager.get_default('reserve_memory_mb', 2048)
@@ -115,42 +186,48 @@ class OptimizedResourceManager:
         Returns:
             Dictionary with processing results and statistics
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         logging.info(f"Starting optimized resource processing for {len(containers_data)} containers")
         
         # Get current resource availability
         available_cores, available_memory = await self.get_available_resources()
         
         # Build resource requests with priority scoring
-        resource_requests = await self._build_resource_requests(
+        planning_start = time.perf_counter()
+        resource_requests = self._build_resource_requests(
             containers_data, available_cores, available_memory, energy_mode
         )
+        self._allocation_stats['last_planning_time'] = time.perf_counter() - planning_start
         
         # Process requests in optimized order
-        results = await self._process_requests_batch(resource_requests)
+        results = await self._process_requests_batch(
+            resource_requests, available_cores, available_memory
+        )
         
         # Update statistics
-        processing_time = time.time() - start_time
-        self._update_allocation_stats(len(containers_data), results, processing_time)
+        processing_time = time.perf_counter() - start_time
+        successful = sum(r['success'] for r in results)
+        failed = len(results) - successful
+        self._update_allocation_stats(len(containers_data), successful, failed, processing_time)
         
         logging.info(f"Optimized resource processing completed in {processing_time:.2f}s")
         
         return {
             'processing_time': processing_time,
             'total_containers': len(containers_data),
-            'successful_operations': sum(1 for r in results if r['success']),
-            'failed_operations': sum(1 for r in results if not r['success']),
+            'successful_operations': successful,
+            'failed_operations': failed,
             'results': results
         }
     
-    async def _build_resource_requests(
+    def _build_resource_requests(
         self,
         containers_data: Dict[str, Dict[str, Any]],
         available_cores: int,
         available_memory: int,
         energy_mode: bool
     ) -> List[ResourceRequest]:
-        """Build prioritized resource requests from container data.
+        """Build priority-scored resource requests from container data.
         
         Args:
             containers_data: Container data dictionary
@@ -159,59 +236,104 @@ class OptimizedResourceManager:
             energy_mode: Energy efficiency mode flag
             
         Returns:
-            List of prioritized resource requests
+            List of resource requests (ordered later during admission)
         """
         requests = []
+        # Host-wide values are the same for every container in this cycle
+        energy_off_peak = energy_mode and self.metrics_calculator.is_off_peak()
+        behavior_multiplier = self.metrics_calculator.get_behavior_multiplier()
         
-        for ctid, usage_data in containers_data.items():
-            if self.config_manager.is_ignored(ctid):
-                continue
-            
-            tier_config = self.config_manager.get_tier_config(ctid)
-            
+        # Resolve configuration for all managed containers in one pass
+        ignored = self._ignored_snapshot
+        tier_view_for = self._tier_view_for
+        candidates = [
+            (ctid, usage_data, tier_view_for(ctid))
+            for ctid, usage_data in containers_data.items()
+            if ctid not in ignored
+        ]
+        
+        # Most containers sit inside both deadbands and need no action
+        if not energy_off_peak:
+            in_deadband = self._in_deadband
+            candidates = [
+                candidate for candidate in candidates
+                if not in_deadband(candidate[1], candidate[2])
+            ]
+        
+        for ctid, usage_data, tier_config in candidates:
             # Calculate CPU requests
-            cpu_request = await self._calculate_cpu_request(
-                ctid, usage_data, tier_config, energy_mode
+            cpu_request = self._calculate_cpu_request(
+                ctid, usage_data, tier_config, energy_off_peak
             )
             if cpu_request:
                 requests.append(cpu_request)
             
             # Calculate memory requests
-            memory_request = await self._calculate_memory_request(
-                ctid, usage_data, tier_config, energy_mode
+            memory_request = self._calculate_memory_request(
+                ctid, usage_data, tier_config, energy_off_peak, behavior_multiplier
             )
             if memory_request:
                 requests.append(memory_request)
         
-        # Sort by priority (highest first)
-        requests.sort(reverse=True)
-        
         return requests
     
-    async def _calculate_cpu_request(
+    def _tier_view_for(self, ctid: str) -> TierView:
+        """Get the memoized tier view for a container.
+        
+        Args:
+            ctid: Container ID
+            
+        Returns:
+            TierView for the container's tier
+        """
+        tier_view = self._tier_views.get(ctid)
+        if tier_view is None:
+            tier_view = TierView.from_config(self.config_manager.get_tier_config(ctid))
+            self._tier_views[ctid] = tier_view
+        return tier_view
+    
+    @staticmethod
+    def _in_deadband(usage_data: Dict[str, Any], tier_config: TierView) -> bool:
+        """Check whether CPU and memory usage are both within their thresholds.
+        
+        Args:
+            usage_data: Container usage data
+            tier_config: Tier configuration view
+            
+        Returns:
+            True if neither resource can produce a scaling request
+        """
+        cpu_usage = usage_data['cpu']
+        if not tier_config.cpu_lower <= cpu_usage <= tier_config.cpu_upper:
+            return False
+        
+        mem_usage_percent = (usage_data['mem'] / usage_data['initial_memory']) * 100
+        return tier_config.mem_lower <= mem_usage_percent <= tier_config.mem_upper
+    
+    def _calculate_cpu_request(
         self,
         ctid: str,
         usage_data: Dict[str, Any],
-        tier_config: Dict[str, Any],
-        energy_mode: bool
+        tier_config: TierView,
+        energy_off_peak: bool
     ) -> Optional[ResourceRequest]:
         """Calculate CPU scaling request for a container.
         
         Args:
             ctid: Container ID
             usage_data: Container usage data
-            tier_config: Tier configuration
-            energy_mode: Energy efficiency mode flag
+            tier_config: Tier configuration view
+            energy_off_peak: Whether energy mode is on and it is off-peak
             
         Returns:
             ResourceRequest or None if no action needed
         """
         current_cores = usage_data["initial_cores"]
         cpu_usage = usage_data['cpu']
-        cpu_upper = tier_config['cpu_upper_threshold']
-        cpu_lower = tier_config['cpu_lower_threshold']
-        min_cores = tier_config['min_cores']
-        max_cores = tier_config['max_cores']
+        cpu_upper = tier_config.cpu_upper
+        cpu_lower = tier_config.cpu_lower
+        min_cores = tier_config.min_cores
+        max_cores = tier_config.max_cores
         
         # Determine scaling action
         action = ScalingAction.NO_ACTION
@@ -219,7 +341,7 @@ class OptimizedResourceManager:
         priority = 0.0
         urgency = 0.0
         
-        if energy_mode and self.metrics_calculator.is_off_peak():
+        if energy_off_peak:
             # Energy mode: scale down to minimum
             if current_cores > min_cores:
                 action = ScalingAction.SCALE_DOWN
@@ -230,8 +352,8 @@ class OptimizedResourceManager:
             # Scale up CPU
             increment = self.metrics_calculator.calculate_increment(
                 cpu_usage, cpu_upper,
-                tier_config.get('core_min_increment', 1),
-                tier_config.get('core_max_increment', 2)
+                tier_config.core_min_inc,
+                tier_config.core_max_inc
             )
             requested_cores = min(max_cores, current_cores + increment)
             
@@ -243,7 +365,7 @@ class OptimizedResourceManager:
             # Scale down CPU
             decrement = self.metrics_calculator.calculate_decrement(
                 cpu_usage, cpu_lower, current_cores,
-                tier_config.get('core_min_increment', 1), min_cores
+                tier_config.core_min_inc, min_cores
             )
             requested_cores = max(min_cores, current_cores - decrement)
             
@@ -254,7 +376,7 @@ class OptimizedResourceManager:
         
         if action != ScalingAction.NO_ACTION:
             return ResourceRequest(
-                container_id=ctid,
+                container_id=sys.intern(ctid),
                 resource_type=ResourceType.CPU,
                 action=action,
                 current_value=current_cores,
@@ -266,29 +388,31 @@ class OptimizedResourceManager:
         
         return None
     
-    async def _calculate_memory_request(
+    def _calculate_memory_request(
         self,
         ctid: str,
         usage_data: Dict[str, Any],
-        tier_config: Dict[str, Any],
-        energy_mode: bool
+        tier_config: TierView,
+        energy_off_peak: bool,
+        behavior_multiplier: float
     ) -> Optional[ResourceRequest]:
         """Calculate memory scaling request for a container.
         
         Args:
             ctid: Container ID
             usage_data: Container usage data
-            tier_config: Tier configuration
-            energy_mode: Energy efficiency mode flag
+            tier_config: Tier configuration view
+            energy_off_peak: Whether energy mode is on and it is off-peak
+            behavior_multiplier: Scaling multiplier for the behaviour mode
             
         Returns:
             ResourceRequest or None if no action needed
         """
         current_memory = usage_data["initial_memory"]
         mem_usage = usage_data['mem']
-        mem_upper = tier_config['memory_upper_threshold']
-        mem_lower = tier_config['memory_lower_threshold']
-        min_memory = tier_config['min_memory']
+        mem_upper = tier_config.mem_upper
+        mem_lower = tier_config.mem_lower
+        min_memory = tier_config.min_memory
         
         # Convert memory usage to percentage
         mem_usage_percent = (mem_usage / current_memory) * 100
@@ -299,9 +423,7 @@ class OptimizedResourceManager:
         priority = 0.0
         urgency = 0.0
         
-        behavior_multiplier = self.metrics_calculator.get_behavior_multiplier()
-        
-        if energy_mode and self.metrics_calculator.is_off_peak():
+        if energy_off_peak:
             # Energy mode: scale down to minimum
             if current_memory > min_memory:
                 action = ScalingAction.SCALE_DOWN
@@ -311,8 +433,8 @@ class OptimizedResourceManager:
         elif mem_usage_percent > mem_upper:
             # Scale up memory
             increment = max(
-                int(tier_config.get('memory_min_increment', 256) * behavior_multiplier),
-                int((mem_usage_percent - mem_upper) * tier_config.get('memory_min_increment', 256) / 10.0)
+                int(tier_config.mem_min_inc * behavior_multiplier),
+                int((mem_usage_percent - mem_upper) * tier_config.mem_min_inc / 10.0)
             )
             requested_memory = current_memory + increment
             
@@ -323,7 +445,7 @@ class OptimizedResourceManager:
             # Scale down memory
             decrement = self.metrics_calculator.calculate_decrement(
                 mem_usage_percent, mem_lower, current_memory,
-                int(tier_config.get('min_decrease_chunk', 128) * behavior_multiplier), 
+                int(tier_config.min_decrease_chunk * behavior_multiplier), 
                 min_memory
             )
             requested_memory = max(min_memory, current_memory - decrement)
@@ -335,7 +457,7 @@ class OptimizedResourceManager:
         
         if action != ScalingAction.NO_ACTION:
             return ResourceRequest(
-                container_id=ctid,
+                container_id=sys.intern(ctid),
                 resource_type=ResourceType.MEMORY,
                 action=action,
                 current_value=current_memory,
@@ -347,11 +469,18 @@ class OptimizedResourceManager:
         
         return None
     
-    async def _process_requests_batch(self, requests: List[ResourceRequest]) -> List[Dict[str, Any]]:
+    async def _process_requests_batch(
+        self,
+        requests: List[ResourceRequest],
+        available_cores: int,
+        available_memory: int
+    ) -> List[Dict[str, Any]]:
         """Process resource requests in optimized batches.
         
         Args:
             requests: List of resource requests
+            available_cores: Available CPU cores
+            available_memory: Available memory in MB
             
         Returns:
             List of processing results
@@ -359,164 +488,177 @@ class OptimizedResourceManager:
         if not requests:
             return []
         
-        # Group requests by resource type for concurrent processing
-        cpu_requests = [r for r in requests if r.resource_type == ResourceType.CPU]
-        memory_requests = [r for r in requests if r.resource_type == ResourceType.MEMORY]
+        # Planning is synchronous, so it cannot interleave with another cycle
+        commands, planned = self._plan_commands(requests, available_cores, available_memory)
+        
+        if not commands:
+            return []
         
-        # Process both resource types concurrently
-        tasks = []
-        if cpu_requests:
-            tasks.append(self._process_cpu_requests(cpu_requests))
-        if memory_requests:
-            tasks.append(self._process_memory_requests(memory_requests))
+        # Submit micro-batches concurrently; every batch runs to completion so
+        # a failing batch cannot cancel commands already issued by the others
+        size = self._micro_batch_size
+        batches = [planned[i:i + size] for i in range(0, len(commands), size)]
+        batch_outcomes = await asyncio.gather(
+            *(
+                self._process_requests_fused(commands[i:i + size], batch_planned)
+                for i, batch_planned in zip(range(0, len(commands), size), batches)
+            ),
+            return_exceptions=True
+        )
         
-        # Wait for all processing to complete
+        # Only the requests of a batch that raised are reported as failed
         results = []
-        if tasks:
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            for batch_result in batch_results:
-                if isinstance(batch_result, list):
-                    results.extend(batch_result)
-                else:
-                    logging.error(f"Error processing resource batch: {batch_result}")
+        for batch_planned, outcome in zip(batches, batch_outcomes):
+            if isinstance(outcome, BaseException):
+                logging.error(f"Error processing resource batch: {outcome}")
+                self._allocation_stats['failed_batches'] += 1
+                for container_requests in batch_planned:
+                    for request in container_requests:
+                        results.append(self._request_result(request, False))
+            else:
+                results.extend(outcome)
         
         return results
     
-    async def _process_cpu_requests(self, requests: List[ResourceRequest]) -> List[Dict[str, Any]]:
-        """Process CPU scaling requests.
+    async def _process_requests_fused(
+        self,
+        commands: List[Tuple[str, int]],
+        planned: List[List[ResourceRequest]]
+    ) -> List[Dict[str, Any]]:
+        """Execute one combined pct set command per container.
         
         Args:
-            requests: List of CPU resource requests
+            commands: Commands with timeouts, one per container
+            planned: Requests covered by each command, in the same order
             
         Returns:
-            List of processing results
+            List of processing results, one per request
         """
         results = []
-        available_cores, _ = await self.get_available_resources()
+        batch_results = await self.async_executor.execute_proxmox_commands_batch(commands)
         
-        async with self._resource_locks[ResourceType.CPU]:
-            # Build batch commands for concurrent execution
-            commands = []
-            request_map = {}
-            
-            for i, request in enumerate(requests):
-                if request.action == ScalingAction.SCALE_UP:
-                    needed_cores = request.requested_value - request.current_value
-                    if available_cores >= needed_cores:
-                        cmd = f"pct set {request.container_id} -cores {request.requested_value}"
-                        commands.append((cmd, 30))  # 30 second timeout
-                        request_map[i] = request
-                        available_cores -= needed_cores
-                elif request.action == ScalingAction.SCALE_DOWN:
-                    cmd = f"pct set {request.container_id} -cores {request.requested_value}"
-                    commands.append((cmd, 30))
-                    request_map[i] = request
-                    available_cores += (request.current_value - request.requested_value)
-            
-            # Execute commands in batch
-            if commands:
-                batch_results = await self.async_executor.execute_proxmox_commands_batch(commands)
-                
-                for i, result in enumerate(batch_results):
-                    if i in request_map:
-                        request = request_map[i]
-                        success = result is not None
-                        
-                        results.append({
-                            'container_id': request.container_id,
-                            'resource_type': 'cpu',
-                            'action': request.action.value,
-                            'success': success,
-                            'old_value': request.current_value,
-                            'new_value': request.requested_value if success else request.current_value
-                        })
-                        
-                        if success:
-                            logging.info(f"CPU scaling successful for container {request.container_id}: "
-                                       f"{request.current_value} -> {request.requested_value} cores")
-                        else:
-                            logging.error(f"CPU scaling failed for container {request.container_id}")
+        for container_requests, result in zip(planned, batch_results):
+            success = result is not None
+            for request in container_requests:
+                results.append(self._request_result(request, success))
         
         return results
     
-    async def _process_memory_requests(self, requests: List[ResourceRequest]) -> List[Dict[str, Any]]:
-        """Process memory scaling requests.
+    @staticmethod
+    def _plan_commands(
+        requests: List[ResourceRequest],
+        available_cores: int,
+        available_memory: int
+    ) -> Tuple[List[Tuple[str, int]], List[List[ResourceRequest]]]:
+        """Admit requests against available capacity and build their commands.
+        
+        Scale-downs are admitted first since they release capacity; scale-ups
+        are then popped from a max-heap by priority until capacity runs out.
+        CPU and memory changes for the same container are combined into a
+        single pct set invocation.
         
         Args:
-            requests: List of memory resource requests
+            requests: Resource requests
+            available_cores: Available CPU cores
+            available_memory: Available memory in MB
             
         Returns:
-            List of processing results
+            Tuple of (commands with timeouts, admitted requests per command)
         """
-        results = []
-        _, available_memory = await self.get_available_resources()
+        available = {
+            ResourceType.CPU: available_cores,
+            ResourceType.MEMORY: available_memory
+        }
+        by_container: Dict[str, List[ResourceRequest]] = {}
+        scale_ups = []
+        
+        for request in requests:
+            if request.action == ScalingAction.SCALE_DOWN:
+                available[request.resource_type] += (request.current_value - request.requested_value)
+                by_container.setdefault(request.container_id, []).append(request)
+            elif request.action == ScalingAction.SCALE_UP:
+                # Index breaks score ties without comparing requests
+                scale_ups.append((-_request_score(request), len(scale_ups), request))
+        
+        # Pop only as many scale-ups as capacity allows: O(n + k log n)
+        heapq.heapify(scale_ups)
+        while scale_ups and (available[ResourceType.CPU] > 0 or available[ResourceType.MEMORY] > 0):
+            request = heapq.heappop(scale_ups)[2]
+            resource_type = request.resource_type
+            needed = request.requested_value - request.current_value
+            if available[resource_type] < needed:
+                continue
+            available[resource_type] -= needed
+            by_container.setdefault(request.container_id, []).append(request)
+        
+        commands = []
+        for ctid, container_requests in by_container.items():
+            options = ' '.join([
+                _PCT_SET_OPTION[r.resource_type](r.requested_value)
+                for r in container_requests
+            ])
+            commands.append((_PCT_SET_CMD(ctid, options), 30))  # 30 second timeout
+        
+        return commands, list(by_container.values())
+    
+    @staticmethod
+    def _request_result(request: ResourceRequest, success: bool) -> Dict[str, Any]:
+        """Log the outcome of a scaling request and build its result entry.
         
-        async with self._resource_locks[ResourceType.MEMORY]:
-            # Build batch commands for concurrent execution
-            commands = []
-            request_map = {}
-            
-            for i, request in enumerate(requests):
-                if request.action == ScalingAction.SCALE_UP:
-                    needed_memory = request.requested_value - request.current_value
-                    if available_memory >= needed_memory:
-                        cmd = f"pct set {request.container_id} -memory {request.requested_value}"
-                        commands.append((cmd, 30))
-                        request_map[i] = request
-                        available_memory -= needed_memory
-                elif request.action == ScalingAction.SCALE_DOWN:
-                    cmd = f"pct set {request.container_id} -memory {request.requested_value}"
-                    commands.append((cmd, 30))
-                    request_map[i] = request
-                    available_memory += (request.current_value - request.requested_value)
+        Args:
+            request: Resource request that was executed
+            success: Whether the pct set command succeeded
             
-            # Execute commands in batch
-            if commands:
-                batch_results = await self.async_executor.execute_proxmox_commands_batch(commands)
-                
-                for i, result in enumerate(batch_results):
-                    if i in request_map:
-                        request = request_map[i]
-                        success = result is not None
-                        
-                        results.append({
-                            'container_id': request.container_id,
-                            'resource_type': 'memory',
-                            'action': request.action.value,
-                            'success': success,
-                            'old_value': request.current_value,
-                            'new_value': request.requested_value if success else request.current_value
-                        })
-                        
-                        if success:
-                            logging.info(f"Memory scaling successful for container {request.container_id}: "
-                                       f"{request.current_value} -> {request.requested_value} MB")
-                        else:
-                            logging.error(f"Memory scaling failed for container {request.container_id}")
+        Returns:
+            Processing result dictionary
+        """
+        if request.resource_type == ResourceType.CPU:
+            label, unit = "CPU", "cores"
+        else:
+            label, unit = "Memory", "MB"
         
-        return results
+        if success:
+            logging.info(f"{label} scaling successful for container {request.container_id}: "
+                       f"{request.current_value} -> {request.requested_value} {unit}")
+        else:
+            logging.error(f"{label} scaling failed for container {request.container_id}")
+        
+        return {
+            'container_id': request.container_id,
+            'resource_type': request.resource_type.value,
+            'action': request.action.value,
+            'success': success,
+            'old_value': request.current_value,
+            'new_value': request.requested_value if success else request.current_value
+        }
     
-    def _update_allocation_stats(self, total_containers: int, results: List[Dict], processing_time: float) -> None:
+    def _update_allocation_stats(
+        self,
+        total_containers: int,
+        successful: int,
+        failed: int,
+        processing_time: float
+    ) -> None:
         """Update allocation statistics.
         
         Args:
             total_containers: Total number of containers processed
-            results: Processing results
+            successful: Number of successful operations
+            failed: Number of failed operations
             processing_time: Time taken for processing
         """
-        successful = sum(1 for r in results if r['success'])
-        failed = len(results) - successful
-        
         self._allocation_stats['total_requests'] += total_containers
         self._allocation_stats['successful_allocations'] += successful
         self._allocation_stats['failed_allocations'] += failed
         
-        # Update average processing time
-        total_requests = self._allocation_stats['total_requests']
+        # Update mean and variance of processing time per run (Welford)
+        runs = self._allocation_stats['processing_runs'] + 1
         current_avg = self._allocation_stats['avg_allocation_time']
-        self._allocation_stats['avg_allocation_time'] = (
-            (current_avg * (total_requests - total_containers) + processing_time) / total_requests
-        )
+        delta = processing_time - current_avg
+        new_avg = current_avg + delta / runs
+        self._allocation_stats['processing_runs'] = runs
+        self._allocation_stats['avg_allocation_time'] = new_avg
+        self._allocation_stats['allocation_time_m2'] += delta * (processing_time - new_avg)
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get resource manager performance statistics."""
@@ -527,6 +669,14 @@ class OptimizedResourceManager:
         else:
             stats['success_rate'] = 0.0
         
+        runs = stats['processing_runs']
+        stats['allocation_time_stddev'] = (stats['allocation_time_m2'] / runs) ** 0.5 if runs else 0.0
+        
+        # Add resource availability cache hit rate
+        hits = _availability_cache_events['hit']
+        lookups = hits + _availability_cache_events['miss']
+        stats['resource_availability_hit_rate'] = (hits / lookups) * 100 if lookups else 0.0
+        
         # Add cache statistics
         stats['cache_stats'] = self.cache.get_stats()
         stats['cache_memory'] = self.cache.get_memory_usage()
@@ -536,7 +686,7 @@ class OptimizedResourceManager:
     async def cleanup(self) -> None:
         """Cleanup resources used by the manager."""
         try:
-            self._thread_pool.shutdown(wait=True)
+            self._tier_views.clear()
             logging.info("Optimized resource manager cleanup completed")
         except Exception as e:
             logging.error(f"Error during resource manager cleanup: {e}")
\ No newline at end of file
@@ -1,39 +1,85 @@
 """High-performance caching system for frequently accessed data."""
 
 import asyncio
+from array import array
 import time
 import logging
-from typing import Any, Dict, Optional, Tuple, Callable, Union
+from typing import Any, Dict, Hashable, Optional, Set, Tuple, Callable, Union
 from dataclasses import dataclass, field
-from functools import wraps
-import json
+from functools import lru_cache, wraps
 import hashlib
-from collections import OrderedDict
+import inspect
+from itertools import chain
+import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
-@dataclass
+# Width in seconds of the expiry buckets swept by the cleanup task
+EXPIRY_BUCKET_SECONDS = 10.0
+_EXPIRY_BUCKET_NS = int(EXPIRY_BUCKET_SECONDS * 1_000_000_000)
+
+# Indices into PerformanceCache._counters
+_HITS, _MISSES, _EVICTIONS, _EXPIRED = range(4)
+
+
+def _key_bytes(value: Any) -> bytes:
+    """Encode a key component as bytes, tagged by type to avoid collisions.
+    
+    Args:
+        value: Function argument value
+        
+    Returns:
+        Bytes representation of the value
+    """
+    value_type = type(value)
+    if value_type is str:
+        return b's' + value.encode()
+    if value_type is bytes:
+        return b'b' + value
+    return b'r' + repr(value).encode()
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a cache entry with metadata."""
     value: Any
-    timestamp: float
-    ttl: float
+    deadline_ns: int
     access_count: int = 0
-    last_accessed: float = field(default_factory=time.time)
+    last_accessed: int = field(default_factory=time.monotonic_ns)
     
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        return time.time() - self.timestamp > self.ttl
+    def is_expired(self, now: int) -> bool:
+        """Check if the cache entry has expired.
+        
+        Args:
+            now: Current time.monotonic_ns() value
+        """
+        return now > self.deadline_ns
     
-    def update_access(self) -> None:
-        """Update access statistics."""
+    def update_access(self, now: int) -> None:
+        """Update access statistics.
+        
+        Args:
+            now: Current time.monotonic_ns() value
+        """
         self.access_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = now
 
 
 class PerformanceCache:
-    """High-performance multi-level cache with LRU eviction and statistics."""
+    """High-performance cache with approximate LRU eviction and statistics.
+    
+    Entries live in two generations of plain dicts (the hashlru scheme): new
+    entries go into the current generation, and once it holds half of
+    max_size it becomes the old generation and the previous old generation
+    is dropped. Hits in the old generation are promoted, so recently used
+    entries survive rotation without maintaining a linked list.
+    """
     
     def __init__(self, max_size: int = 1000, default_ttl: float = 300.0):
         """Initialize the performance cache.
@@ -44,19 +90,15 @@ class PerformanceCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.RLock()
-        
-        # Performance statistics
-        self._stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'expired_cleanups': 0,
-            'total_requests': 0,
-            'cache_size': 0,
-            'hit_rate': 0.0
-        }
+        self._half = max(1, max_size // 2)
+        self._new: Dict[Hashable, CacheEntry] = {}
+        self._old: Dict[Hashable, CacheEntry] = {}
+        # Keys grouped by the expiry bucket their deadline falls into
+        self._expiry_buckets: Dict[int, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        
+        # Performance counters; derived statistics are computed in get_stats()
+        self._counters = array('Q', [0] * 4)
         
         # Cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -78,7 +120,8 @@ class PerformanceCache:
         while self._running:
             try:
                 await asyncio.sleep(interval)
-                self._cleanup_expired()
+                # Sweep on a worker thread so the event loop keeps running
+                await asyncio.to_thread(self._cleanup_expired)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -87,65 +130,112 @@ class PerformanceCache:
     def _cleanup_expired(self) -> None:
         """Remove expired entries from the cache."""
         with self._lock:
-            expired_keys = []
-            for key, entry in self._cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._cache[key]
-                self._stats['expired_cleanups'] += 1
+            now = time.monotonic_ns()
+            now_bucket = now // _EXPIRY_BUCKET_NS
+            expired = 0
             
-            if expired_keys:
-                logging.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+            # Only buckets whose whole time range has passed are swept; keys
+            # that were overwritten, evicted or deleted since are skipped
+            due_buckets = [bucket for bucket in self._expiry_buckets if bucket < now_bucket]
+            for bucket in due_buckets:
+                for key in self._expiry_buckets.pop(bucket):
+                    for generation in (self._new, self._old):
+                        entry = generation.get(key)
+                        if entry is not None and entry.is_expired(now):
+                            del generation[key]
+                            expired += 1
             
-            self._stats['cache_size'] = len(self._cache)
+            self._counters[_EXPIRED] += expired
+            if expired:
+                logging.debug(f"Cleaned up {expired} expired cache entries")
     
-    def _evict_lru(self) -> None:
-        """Evict least recently used items to make space."""
-        with self._lock:
-            while len(self._cache) >= self.max_size:
-                # Remove the oldest item (LRU)
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._stats['evictions'] += 1
-            
-            self._stats['cache_size'] = len(self._cache)
+    def _insert(self, key: Hashable, entry: CacheEntry) -> None:
+        """Insert an entry into the current generation, rotating when full.
+        
+        Must be called with the lock held.
+        
+        Args:
+            key: Cache key
+            entry: Cache entry to store
+        """
+        if len(self._new) >= self._half:
+            # Drop the old generation; whatever was not promoted is evicted
+            self._counters[_EVICTIONS] += len(self._old)
+            self._old = self._new
+            self._new = {}
+        
+        self._new[key] = entry
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get a value from the cache.
         
+        Hits in the current generation are served without taking the lock;
+        a single dict lookup is atomic under the GIL. The lock is only taken
+        to promote an entry from the old generation or to drop an expired one.
+        
         Args:
             key: Cache key
             
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            self._stats['total_requests'] += 1
+        counters = self._counters
+        entry = self._new.get(key)
+        if entry is None:
+            return self._get_promoted(key)
+        
+        # Expiry check and access update inlined for the hot path
+        now = time.monotonic_ns()
+        if now > entry.deadline_ns:
+            with self._lock:
+                # Leave the key alone if it was overwritten in the meantime
+                if self._new.get(key) is entry:
+                    del self._new[key]
+            counters[_MISSES] += 1
+            return None
+        
+        entry.access_count += 1
+        entry.last_accessed = now
+        counters[_HITS] += 1
+        return entry.value
+    
+    def _get_promoted(self, key: Hashable) -> Optional[Any]:
+        """Look a key up in the old generation and promote it on a hit.
+        
+        Args:
+            key: Cache key that was not found in the current generation
             
-            if key in self._cache:
-                entry = self._cache[key]
-                
-                if entry.is_expired():
-                    del self._cache[key]
-                    self._stats['misses'] += 1
-                    self._stats['cache_size'] = len(self._cache)
+        Returns:
+            Cached value or None if not found/expired
+        """
+        counters = self._counters
+        with self._lock:
+            # Another thread may have promoted or set the key since the miss
+            entry = self._new.get(key)
+            promote = entry is None
+            if promote:
+                entry = self._old.pop(key, None)
+                if entry is None:
+                    counters[_MISSES] += 1
                     return None
-                
-                # Move to end (most recently used)
-                self._cache.move_to_end(key)
-                entry.update_access()
-                
-                self._stats['hits'] += 1
-                self._update_hit_rate()
-                return entry.value
             
-            self._stats['misses'] += 1
-            self._update_hit_rate()
-            return None
+            now = time.monotonic_ns()
+            if now > entry.deadline_ns:
+                if not promote:
+                    del self._new[key]
+                counters[_MISSES] += 1
+                return None
+            
+            # Promote recently used entries out of the old generation
+            if promote:
+                self._insert(key, entry)
+            entry.access_count += 1
+            entry.last_accessed = now
+            
+            counters[_HITS] += 1
+            return entry.value
     
-    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
         """Set a value in the cache.
         
         Args:
@@ -153,25 +243,31 @@ class PerformanceCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if None)
         """
+        # Interned string keys let later dict lookups match by identity
+        if type(key) is str:
+            key = sys.intern(key)
+        
         with self._lock:
             ttl = ttl or self.default_ttl
             
-            # Evict old entries if necessary
-            if len(self._cache) >= self.max_size:
-                self._evict_lru()
-            
+            now = time.monotonic_ns()
+            deadline_ns = now + int(ttl * 1_000_000_000)
             entry = CacheEntry(
                 value=value,
-                timestamp=time.time(),
-                ttl=ttl
+                deadline_ns=deadline_ns,
+                last_accessed=now
             )
             
-            self._cache[key] = entry
-            self._cache.move_to_end(key)  # Mark as most recently used
+            bucket = deadline_ns // _EXPIRY_BUCKET_NS
+            self._expiry_buckets.setdefault(bucket, set()).add(key)
             
-            self._stats['cache_size'] = len(self._cache)
+            self._old.pop(key, None)
+            if key in self._new:
+                self._new[key] = entry
+            else:
+                self._insert(key, entry)
     
-    def delete(self, key: str) -> bool:
+    def delete(self, key: Hashable) -> bool:
         """Delete a key from the cache.
         
         Args:
@@ -181,36 +277,41 @@ class PerformanceCache:
             True if key was deleted, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._stats['cache_size'] = len(self._cache)
-                return True
-            return False
+            return (self._new.pop(key, None) is not None) | (self._old.pop(key, None) is not None)
     
     def clear(self) -> None:
         """Clear all entries from the cache."""
         with self._lock:
-            self._cache.clear()
-            self._stats['cache_size'] = 0
+            self._new.clear()
+            self._old.clear()
+            self._expiry_buckets.clear()
             logging.info("Cache cleared")
     
-    def _update_hit_rate(self) -> None:
-        """Update the hit rate statistic."""
-        if self._stats['total_requests'] > 0:
-            self._stats['hit_rate'] = (self._stats['hits'] / self._stats['total_requests']) * 100
-    
     def get_stats(self) -> Dict[str, Union[int, float]]:
         """Get cache performance statistics."""
         with self._lock:
-            return self._stats.copy()
+            hits, misses, evictions, expired = self._counters
+            # Every lookup counts as exactly one hit or miss
+            total = hits + misses
+            return {
+                'hits': hits,
+                'misses': misses,
+                'evictions': evictions,
+                'expired_cleanups': expired,
+                'total_requests': total,
+                'cache_size': len(self._new) + len(self._old),
+                'hit_rate': (hits / total) * 100 if total > 0 else 0.0
+            }
     
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage statistics."""
         with self._lock:
-            total_entries = len(self._cache)
+            total_entries = len(self._new) + len(self._old)
             avg_access_count = 0
             if total_entries > 0:
-                avg_access_count = sum(entry.access_count for entry in self._cache.values()) / total_entries
+                avg_access_count = sum(
+                    entry.access_count for entry in chain(self._new.values(), self._old.values())
+                ) / total_entries
             
             return {
                 'total_entries': total_entries,
@@ -241,6 +342,10 @@ class SmartCache:
             cache: Underlying performance cache instance
         """
         self.cache = cache
+        # Copying a fresh hasher is cheaper than constructing one per key;
+        # use a non-cryptographic hash when available, otherwise a 64-bit
+        # BLAKE2b digest, which is cheaper than MD5 and plenty wide
+        self._hasher_template = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
     
     def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """Generate a cache key from function name and arguments.
@@ -253,36 +358,93 @@ class SmartCache:
         Returns:
             Generated cache key
         """
-        # Create a hashable representation of arguments
-        key_data = {
-            'func': func_name,
-            'args': args,
-            'kwargs': sorted(kwargs.items()) if kwargs else {}
-        }
-        
-        # Convert to JSON string and hash for consistent keys
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        # Feed arguments straight into the hasher without an intermediate string;
+        # every component is length-prefixed so its bytes cannot run into the next
+        hasher = self._hasher_template.copy()
+        update = hasher.update
+        
+        def component(tag: bytes, data: bytes) -> None:
+            update(tag)
+            update(len(data).to_bytes(8, 'little'))
+            update(data)
+        
+        component(b'f', func_name.encode())
+        for arg in args:
+            component(b'a', _key_bytes(arg))
+        for name in sorted(kwargs):
+            component(b'k', name.encode())
+            component(b'v', _key_bytes(kwargs[name]))
+        return sys.intern(hasher.hexdigest())
+    
+    def _key_builder(self, func: Callable, key_prefix: str) -> Callable[[tuple, dict], Hashable]:
+        """Choose the cheapest cache key scheme for a function at decoration time.
+        
+        Functions without parameters share one constant key. Otherwise the
+        key is a tuple of the arguments and their types, falling back to a
+        hashed string key when an argument is unhashable.
+        
+        Args:
+            func: Function being decorated
+            key_prefix: Prefix for cache keys
+            
+        Returns:
+            Callable mapping (args, kwargs) to a cache key
+        """
+        qualname = func.__qualname__
+        
+        if not inspect.signature(func).parameters:
+            constant_key = sys.intern(f"{key_prefix}{qualname}")
+            return lambda args, kwargs: constant_key
+        
+        def make_key(args: tuple, kwargs: dict) -> Hashable:
+            # Argument types are part of the key (like lru_cache(typed=True)) so
+            # equal values of different types, such as 1, 1.0 and True, stay apart
+            if kwargs:
+                items = tuple(sorted(kwargs.items()))
+                key = (key_prefix, qualname, args, tuple(map(type, args)),
+                       items, tuple(type(value) for _, value in items))
+            else:
+                key = (key_prefix, qualname, args, tuple(map(type, args)))
+            try:
+                hash(key)
+            except TypeError:
+                return sys.intern(f"{key_prefix}{self._generate_key(func.__name__, args, kwargs)}")
+            return key
+        
+        return make_key
     
-    def cached(self, ttl: Optional[float] = None, key_prefix: str = ""):
+    def cached(
+        self,
+        ttl: Optional[float] = None,
+        key_prefix: str = "",
+        metrics_sink: Optional[Callable[[str], None]] = None
+    ):
         """Decorator for caching function results.
         
         Args:
             ttl: Time-to-live for cached result
             key_prefix: Prefix for cache keys
+            metrics_sink: Optional callable receiving 'hit' or 'miss' per lookup
         """
         def decorator(func: Callable) -> Callable:
+            make_key = self._key_builder(func, key_prefix)
+            
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 # Generate cache key
-                cache_key = f"{key_prefix}{self._generate_key(func.__name__, args, kwargs)}"
+                cache_key = make_key(args, kwargs)
                 
                 # Try to get from cache
                 cached_result = self.cache.get(cache_key)
                 if cached_result is not None:
                     logging.debug(f"Cache hit for {func.__name__}")
+                    if metrics_sink is not None:
+                        metrics_sink('hit')
                     return cached_result
                 
+                if metrics_sink is not None:
+                    metrics_sink('miss')
+                
                 # Execute function and cache result
                 result = func(*args, **kwargs)
                 self.cache.set(cache_key, result, ttl)
@@ -292,14 +454,19 @@ class SmartCache:
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 # Generate cache key
-                cache_key = f"{key_prefix}{self._generate_key(func.__name__, args, kwargs)}"
+                cache_key = make_key(args, kwargs)
                 
                 # Try to get from cache
                 cached_result = self.cache.get(cache_key)
                 if cached_result is not None:
                     logging.debug(f"Cache hit for {func.__name__}")
+                    if metrics_sink is not None:
+                        metrics_sink('hit')
                     return cached_result
                 
+                if metrics_sink is not None:
+                    metrics_sink('miss')
+                
                 # Execute function and cache result
                 result = await func(*args, **kwargs)
                 self.cache.set(cache_key, result, ttl)
@@ -313,6 +480,54 @@ class SmartCache:
                 return sync_wrapper
         
         return decorator
+    
+    def cached_fast(self, ttl: Optional[float] = None, maxsize: int = 128):
+        """Decorator caching results in functools.lru_cache instead of this cache.
+        
+        Intended for cheap, frequently called functions with hashable
+        arguments, where the cost of the cached() wrapper dominates. Without
+        a TTL results are kept until evicted by LRU. With a TTL the current
+        time bucket of width ttl is passed as an extra key argument, so
+        entries expire at the next bucket boundary (after at most ttl
+        seconds). Like cached(), arguments of different types are cached
+        separately and a TTL of 0 means the cache's default TTL.
+        
+        Coroutine functions fall back to cached(), where a ttl of None also
+        means the cache's default TTL rather than caching indefinitely.
+        
+        Args:
+            ttl: Optional time-to-live in seconds; None caches indefinitely
+            maxsize: Maximum number of results kept by the LRU cache
+            
+        Raises:
+            ValueError: If ttl is negative or shorter than one nanosecond
+        """
+        period_ns = None
+        if ttl is not None:
+            period_ns = int((ttl or self.cache.default_ttl) * 1_000_000_000)
+            if period_ns <= 0:
+                raise ValueError(f"cached_fast ttl must be positive, got {ttl}")
+        
+        def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+                return self.cached(ttl=ttl)(func)
+            
+            if period_ns is None:
+                return lru_cache(maxsize=maxsize, typed=True)(func)
+            
+            @lru_cache(maxsize=maxsize, typed=True)
+            def cached_call(_generation, *args, **kwargs):
+                return func(*args, **kwargs)
+            
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return cached_call(time.monotonic_ns() // period_ns, *args, **kwargs)
+            
+            wrapper.cache_info = cached_call.cache_info
+            wrapper.cache_clear = cached_call.cache_clear
+            return wrapper
+        
+        return decorator
 
 
 # Global cache instances
@@ -328,9 +543,17 @@ def get_smart_cache() -> SmartCache:
     """Get the global smart cache instance."""
     return _smart_cache
 
-def cached(ttl: Optional[float] = None, key_prefix: str = ""):
+def cached(
+    ttl: Optional[float] = None,
+    key_prefix: str = "",
+    metrics_sink: Optional[Callable[[str], None]] = None
+):
     """Global cached decorator."""
-    return _smart_cache.cached(ttl=ttl, key_prefix=key_prefix)
+    return _smart_cache.cached(ttl=ttl, key_prefix=key_prefix, metrics_sink=metrics_sink)
+
+def cached_fast(ttl: Optional[float] = None, maxsize: int = 128):
+    """Global lru_cache-backed cached decorator."""
+    return _smart_cache.cached_fast(ttl=ttl, maxsize=maxsize)
 
 async def initialize_global_cache() -> None:
     """Initialize the global cache system."""